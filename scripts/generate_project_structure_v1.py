@@ -1,5 +1,8 @@
 import os
 
+# 目录/文件的创建逻辑与 v2 共用 (按目录 dir_fd 相对创建、线程池并发写入)
+from generate_project_structure_v2 import create_structure
+
 # 定义目录和文件结构
 structure = {
     "src": {
@@ -129,17 +132,6 @@ structure = {
     "notebooks": {},
 }
 
-# 创建目录和文件
-def create_structure(base_path, structure):
-    for name, content in structure.items():
-        path = os.path.join(base_path, name)
-        if isinstance(content, dict):
-            os.makedirs(path, exist_ok=True)
-            create_structure(path, content)
-        else:
-            with open(path, "w") as f:
-                f.write(content)
-
 # 确保 scripts 目录存在
 scripts_dir = os.path.join(os.getcwd(), "scripts")
 os.makedirs(scripts_dir, exist_ok=True)
@@ -1,4 +1,6 @@
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
 # 定义目录结构 (忽略最外层的 "scrsit" 目录)
 structure = {
@@ -231,17 +233,87 @@ structure = {
     }
 }
 
-def create_structure(base_path, tree):
-    for name, content in tree.items():
-        path = os.path.join(base_path, name)
-        if isinstance(content, dict):
-            os.makedirs(path, exist_ok=True)
-            create_structure(path, content)
+def _flatten(base_path, tree):
+    """迭代遍历嵌套字典，依次产出 (路径, 内容)；目录的内容为 None。"""
+    stack = [(base_path, tree)]
+    while stack:
+        parent, subtree = stack.pop()
+        for name, content in subtree.items():
+            path = os.path.join(parent, name)
+            if isinstance(content, dict):
+                yield path, None
+                stack.append((path, content))
+            else:
+                yield path, content
+
+
+def create_structure(base_path, tree, max_workers=32):
+    """
+    根据嵌套字典创建目录和文件。
+
+    先遍历整棵树收集所有目录与文件，单线程按层级顺序创建目录
+    (每个目录只调用一次 os.makedirs)，再用线程池并发写入文件：
+    文件创建受 I/O 延迟主导，open/write/close 期间会释放 GIL。
+    空文件直接通过 os.open 创建，跳过 Python 文件对象与缓冲写入器的开销。
+    """
+    dirs = set()
+    files = []
+    for path, content in _flatten(base_path, tree):
+        if content is None:
+            dirs.add(path)
         else:
             # 如果上层目录不存在则创建
-            os.makedirs(os.path.dirname(path), exist_ok=True)
-            with open(path, 'w', encoding="utf-8") as f:
-                f.write(content)
+            dirs.add(os.path.dirname(path))
+            files.append((path, content))
+
+    for d in sorted(dirs):
+        os.makedirs(d, exist_ok=True)
+
+    if sys.platform == "linux" and os.open in os.supports_dir_fd:
+        grouped = {}
+        for path, content in files:
+            dirname, filename = os.path.split(path)
+            grouped.setdefault(dirname, []).append((filename, content))
+        tasks, worker = grouped.items(), _write_dir_group
+    else:
+        tasks, worker = files, _write_leaf
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # 消费迭代器，使工作线程中的异常在此处抛出
+        for _ in executor.map(worker, tasks):
+            pass
+
+
+def _write_leaf(item):
+    """写入单个文件。"""
+    path, content = item
+    if content == "":
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644))
+    else:
+        with open(path, "wb", buffering=65536) as f:
+            f.write(content.encode("utf-8"))
+
+
+def _write_dir_group(item):
+    """
+    Linux 下写入同一目录中的全部文件：目录只打开一次，
+    之后通过 dir_fd 相对创建文件，省去每个文件的完整路径解析。
+    """
+    dirname, entries = item
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    dir_fd = os.open(dirname or ".", os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for filename, content in entries:
+            fd = os.open(filename, flags, 0o644, dir_fd=dir_fd)
+            try:
+                if content:
+                    data = memoryview(content.encode("utf-8"))
+                    while data:
+                        data = data[os.write(fd, data):]
+            finally:
+                os.close(fd)
+    finally:
+        os.close(dir_fd)
 
 if __name__ == "__main__":
     base_dir = os.getcwd()  # 可根据需要修改基础路径
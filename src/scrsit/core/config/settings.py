@@ -4,6 +4,7 @@
 使用 Pydantic 定义应用配置模型，加载来自 .env、环境变量等的配置。
 """
 import logging
+from functools import lru_cache
 from typing import List, Dict, Optional
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -31,6 +32,13 @@ class AppSettings(BaseSettings):
     # --- 日志配置 ---
     log_level: str = "INFO"
 
+    # --- 插件加载 ---
+    # False (默认): 启动时只发现入口点，首次获取插件时才导入插件类，避免加载用不到的重量级依赖；
+    # True: 启动时即导入全部插件类 (生产环境预热)
+    eager_plugin_load: bool = False
+    # 预加载时用线程池并发导入插件类 (重叠各插件导入时的磁盘 I/O)，仅在 eager_plugin_load 为 True 时生效
+    parallel_plugin_load: bool = False
+
     # --- 插件选择与配置 ---
     # 解析器配置 (示例：可以指定默认或按类型指定)
     default_parser: Optional[str] = None # 例如 "pdf_default"
@@ -80,24 +88,22 @@ def load_settings() -> AppSettings:
         logger.exception("加载应用配置时出错。", exc_info=True)
         raise ConfigurationError(f"加载配置失败: {e}") from e
 
-# 全局配置实例 (惰性加载)
-_settings_instance: Optional[AppSettings] = None
-
+@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
     """
-    获取全局唯一的 AppSettings 实例。
-    如果尚未加载，则加载它。
+    获取全局唯一的 AppSettings 实例 (惰性加载)。
+    首次调用时加载，之后直接返回缓存的实例；
+    需要重新加载时可调用 get_settings.cache_clear()。
     """
-    global _settings_instance
-    if _settings_instance is None:
-        _settings_instance = load_settings()
-    return _settings_instance
+    return load_settings()
 
 if __name__ == '__main__':
     try:
         settings = get_settings()
         print("应用配置加载测试:")
         print(f"日志级别: {settings.log_level}")
+        print(f"预加载插件: {settings.eager_plugin_load}")
+        print(f"并发预加载插件: {settings.parallel_plugin_load}")
         print(f"默认解析器: {settings.default_parser}")
         print(f"解析器映射: {settings.parser_mapping}")
         print(f"默认分块器: {settings.default_chunker}")
@@ -5,9 +5,10 @@
 这些是在系统内部流转的数据结构，基于 UML 图设计。
 """
 from typing import List, Optional, Dict, Any, Union, Literal
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 import datetime
+import sys
 
 from src.scrsit.core.utils.helpers import generate_uuid
 
@@ -15,7 +16,7 @@ from src.scrsit.core.utils.helpers import generate_uuid
 
 class Element(BaseModel):
     """文档中可识别的基础内容元素的基类 (概念上的，实际嵌入到 Document 中)。"""
-    id: str = Field(default_factory=lambda: generate_uuid()) # 元素唯一ID
+    id: str = Field(default_factory=generate_uuid)           # 元素唯一ID
     name: Optional[str] = None                               # 元素名称 (例如，图表标题)
     content: Optional[Union[str, bytes]] = None              # 元素原始内容 (文本或二进制)
     description: Optional[str] = None                        # 元素描述
@@ -60,7 +61,7 @@ class Link(Element):
 
 class StructuredContent(BaseModel):
     """表示文档的结构化内容，例如章节、段落。"""
-    id: str = Field(default_factory=lambda: generate_uuid())      # 结构唯一ID
+    id: str = Field(default_factory=generate_uuid)                # 结构唯一ID
     parent_id: Optional[str] = None                                # 父结构ID (用于构建层级)
     level: int = 0                                                 # 结构层级 (例如 0:文档, 1:章, 2:节)
     content: str                                                   # 该结构单元的文本内容
@@ -90,7 +91,7 @@ class EntityType(str, Enum):
 
 class Chunk(BaseModel):
     """文档内容的切片（块）。"""
-    id: str = Field(default_factory=lambda: generate_uuid())      # Chunk 唯一 ID
+    id: str = Field(default_factory=generate_uuid)                # Chunk 唯一 ID
     doc_id: str                                                    # 所属文档 ID
     order_index: int                                               # Chunk 在文档中的顺序
     tokens: Optional[int] = None                                   # Chunk 的 token 数量 (可选)
@@ -100,7 +101,7 @@ class Chunk(BaseModel):
 
 class Entity(BaseModel):
     """从文档中提取的实体。"""
-    id: str = Field(default_factory=lambda: generate_uuid())      # 实体唯一 ID
+    id: str = Field(default_factory=generate_uuid)                # 实体唯一 ID
     name: str                                                      # 实体名称/文本
     type: Union[EntityType, str] = EntityType.NEUTRAL              # 实体类型 (使用枚举或字符串)
     description: Optional[str] = None                              # 实体的描述
@@ -110,7 +111,7 @@ class Entity(BaseModel):
 
 class Relationship(BaseModel):
     """实体之间的关系。"""
-    id: str = Field(default_factory=lambda: generate_uuid())      # 关系唯一 ID
+    id: str = Field(default_factory=generate_uuid)                # 关系唯一 ID
     from_entity_id: str                                            # 起始实体 ID
     to_entity_id: str                                              # 目标实体 ID
     weight: Optional[float] = None                                 # 关系权重/强度
@@ -119,11 +120,17 @@ class Relationship(BaseModel):
     sources: Dict[str, List[str]] = Field(default_factory=dict)    # 来源信息 {doc_id: [chunk_id1, chunk_id2]}
     embedding: Optional[List[float]] = Field(exclude=True, default=None) # 临时存储的 Embedding
 
+    @field_validator("keywords")
+    @classmethod
+    def _intern_keywords(cls, v: List[str]) -> List[str]:
+        # 大量关系通常共享同一批关键词，驻留后重复字符串只保留一份
+        return [sys.intern(k) for k in v] if v else v
+
 class Document(BaseModel):
     """
     核心文档模型，代表一个被处理的文档及其分析结果。
     """
-    id: str = Field(default_factory=lambda: generate_uuid())          # 文档唯一 ID
+    id: str = Field(default_factory=generate_uuid)                    # 文档唯一 ID
     name: str                                                          # 文档名称 (例如文件名)
     type: DocumentType = DocumentType.UNKNOWN                        # 文档类型 (根据文件扩展名或内容猜测)
     checksum: Optional[str] = None                                     # 文档内容的校验和 (例如 sha1)
@@ -39,6 +39,20 @@ class PluginError(ScrsitError):
         full_message = f"插件 '{plugin_name}' 发生错误: {message}"
         super().__init__(full_message)
 
+class PluginLoadError(PluginError):
+    """插件加载 (导入入口点) 或实例化失败。"""
+    def __init__(self, plugin_name: str = "未知插件", original_exception: Exception = None):
+        self.original_exception = original_exception
+        message = "插件加载失败。"
+        if original_exception is not None:
+            message = f"插件加载失败: {original_exception}"
+        super().__init__(plugin_name=plugin_name, message=message)
+
+class PluginConfigurationError(PluginError):
+    """插件配置无效。"""
+    def __init__(self, plugin_name: str = "未知插件", message: str = "插件配置无效。"):
+        super().__init__(plugin_name=plugin_name, message=message)
+
 # --- 接口相关的通用插件错误 ---
 # 这些可以被具体插件实现中的错误继承
 
@@ -64,7 +78,7 @@ class ProviderError(PluginError):
         # 这里继承 PluginError 强调它是通过插件接口发生的
         super().__init__(plugin_name=provider_name, message=message)
 
-class StoreError(PluginError):
+class StorageError(PluginError):
     """与数据存储交互时发生的通用错误。"""
     def __init__(self, store_name: str = "未知存储", message: str = "数据存储操作失败。"):
         super().__init__(plugin_name=store_name, message=message)
@@ -1,24 +1,60 @@
 # src/scrsit/core/interfaces/__init__.py
 # 插件接口定义包
-from src.scrsit.core.interfaces.base_analyzer import BaseAnalyzer
-from src.scrsit.core.interfaces.base_chunker import BaseChunker
-from src.scrsit.core.interfaces.base_document_store import BaseDocumentStore
-from src.scrsit.core.interfaces.base_embedder import BaseEmbedder
-from src.scrsit.core.interfaces.base_knowledge_provider import BaseKnowledgeProvider
-from src.scrsit.core.interfaces.base_llm_provider import BaseLLMProvider
-from src.scrsit.core.interfaces.base_multimodal_provider import BaseMultimodalProvider
-from src.scrsit.core.interfaces.base_ocr_provider import BaseOCRProvider
-from src.scrsit.core.interfaces.base_parser import BaseParser
-from src.scrsit.core.interfaces.base_proposal_generator import BaseProposalGenerator
-from src.scrsit.core.interfaces.base_reviewer import BaseReviewer
-from src.scrsit.core.interfaces.base_structured_store import BaseStructuredStore
-from src.scrsit.core.interfaces.base_vector_store import BaseVectorStore
-
-from typing import Dict, Optional, Any
+# 各接口模块依赖 pydantic、PIL 等第三方库，按需 (首次访问属性时) 再导入，
+# 只用到单个接口的调用方不必加载全部接口模块
+import importlib
+from typing import TYPE_CHECKING, Dict, Optional, Any
+
+if TYPE_CHECKING: # 仅供类型检查器/IDE 解析，运行时仍由 __getattr__ 延迟导入
+    from src.scrsit.core.interfaces.base_analyzer import AnalysisType, BaseAnalyzer
+    from src.scrsit.core.interfaces.base_chunker import BaseChunker
+    from src.scrsit.core.interfaces.base_document_store import BaseDocumentStore
+    from src.scrsit.core.interfaces.base_embedder import BaseEmbedder
+    from src.scrsit.core.interfaces.base_knowledge_provider import BaseKnowledgeProvider
+    from src.scrsit.core.interfaces.base_llm_provider import BaseLLMProvider
+    from src.scrsit.core.interfaces.base_multimodal_provider import BaseMultimodalProvider
+    from src.scrsit.core.interfaces.base_ocr_provider import BaseOCRProvider
+    from src.scrsit.core.interfaces.base_parser import BaseParser
+    from src.scrsit.core.interfaces.base_proposal_generator import BaseProposalGenerator
+    from src.scrsit.core.interfaces.base_reviewer import BaseReviewer
+    from src.scrsit.core.interfaces.base_structured_store import BaseStructuredStore
+    from src.scrsit.core.interfaces.base_vector_store import BaseVectorStore
+
+_LAZY_EXPORTS = {
+    "AnalysisType": ".base_analyzer",
+    "BaseAnalyzer": ".base_analyzer",
+    "BaseChunker": ".base_chunker",
+    "BaseDocumentStore": ".base_document_store",
+    "BaseEmbedder": ".base_embedder",
+    "BaseKnowledgeProvider": ".base_knowledge_provider",
+    "BaseLLMProvider": ".base_llm_provider",
+    "BaseMultimodalProvider": ".base_multimodal_provider",
+    "BaseOCRProvider": ".base_ocr_provider",
+    "BaseParser": ".base_parser",
+    "BaseProposalGenerator": ".base_proposal_generator",
+    "BaseReviewer": ".base_reviewer",
+    "BaseStructuredStore": ".base_structured_store",
+    "BaseVectorStore": ".base_vector_store",
+}
+
+__all__ = ["BasePluginInterface", *_LAZY_EXPORTS]
+
+def __getattr__(name: str):
+    try:
+        module_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
 # 可以定义一个所有插件接口的基类，如果需要统一处理
 class BasePluginInterface:
     """所有插件接口的抽象基类 (可选)。"""
+    __slots__ = ("config",)
     plugin_name: str # 插件的唯一名称
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
@@ -1,16 +1,26 @@
 # src/scrsit/core/interfaces/base_analyzer.py
 import abc
+from enum import Enum
 from typing import List, Union, Dict, Any
 
 from src.scrsit.core.document.models import Document, Chunk, Entity, Relationship # 等分析结果
 
 AnalysisResult = Union[List[Entity], List[Relationship], Dict[str, Any]] # 可扩展
 
+class AnalysisType(str, Enum):
+    """分析类型。继承 str，与旧的字符串值比较仍然成立。"""
+    ENTITY_EXTRACTION = "entity_extraction"
+    KEYWORD_EXTRACTION = "keyword_extraction"
+    RELATIONSHIP_EXTRACTION = "relationship_extraction"
+    # 可扩展
+
 class BaseAnalyzer(abc.ABC):
     """
     内容分析器接口定义。
     负责从文档或块中提取信息，如实体、关系、关键词等。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def analyze(self, content: Union[Document, Chunk, str], **kwargs) -> AnalysisResult:
         """
@@ -31,8 +41,8 @@ class BaseAnalyzer(abc.ABC):
 
     @property
     @abc.abstractmethod
-    def analysis_type(self) -> str:
+    def analysis_type(self) -> AnalysisType:
         """
-        返回该分析器执行的分析类型 (例如, "entity_extraction", "keyword_extraction")。
+        返回该分析器执行的分析类型 (例如, AnalysisType.ENTITY_EXTRACTION)。
         """
         pass
\ No newline at end of file
@@ -9,6 +9,8 @@ class BaseChunker(abc.ABC):
     文档分块器接口定义。
     负责将 Document 对象的内容切分成合适的 Chunk 列表。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def chunk(self, document: Document, **kwargs) -> List[Chunk]:
         """
@@ -1,14 +1,56 @@
 # src/scrsit/core/interfaces/base_document_store.py
 import abc
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Callable, Iterable, Tuple
 
 from src.scrsit.core.document.models import Document
+from src.scrsit.core.utils.helpers import map_concurrently
+
+_MISSING = object()
+
+def _compile_path(path: str) -> Callable[[Any], Any]:
+    """把 "metadata.author" 这样的点分路径编译为取值函数 (只在编译时拆分一次)。"""
+    parts = tuple(path.split("."))
+
+    def resolve(obj: Any) -> Any:
+        for part in parts:
+            if isinstance(obj, dict):
+                obj = obj.get(part, _MISSING)
+            else:
+                obj = getattr(obj, part, _MISSING)
+            if obj is _MISSING:
+                return _MISSING
+        return obj
+
+    return resolve
+
+@lru_cache(maxsize=256)
+def _compile_items(items: Tuple[Tuple[str, Any], ...]) -> Callable[[Document], bool]:
+    checks = [(_compile_path(path), expected) for path, expected in items]
+    return lambda doc: all(resolve(doc) == expected for resolve, expected in checks)
+
+def _compile_query(query: Dict[str, Any]) -> Callable[[Document], bool]:
+    """
+    把查询字典 (例如 {"metadata.author": "John Doe"}) 编译为文档谓词。
+    所有条件按相等比较并取 AND；值可哈希时编译结果会被缓存复用。
+    """
+    items = tuple(sorted(query.items()))
+    try:
+        return _compile_items(items)
+    except TypeError: # 查询值不可哈希，跳过缓存
+        return _compile_items.__wrapped__(items)
 
 class BaseDocumentStore(abc.ABC):
     """
     文档存储接口定义。
     负责持久化和检索完整的 Document 对象。
     """
+    __slots__ = ()
+
+    # save/get/delete_batch 默认实现逐条调用时的并发线程数。默认 1 (串行)，因为基类无法确定后端的
+    # 单条方法是否线程安全；RTT 受限且线程安全的后端可调大，有原生批量接口的后端应直接覆盖批量方法
+    batch_max_workers: int = 1
+
     @abc.abstractmethod
     def save(self, document: Document, **kwargs) -> None:
         """
@@ -36,8 +78,7 @@ class BaseDocumentStore(abc.ABC):
             NotImplementedError: 如果子类不支持批处理。
         """
         # 默认实现是逐个调用 save
-        for doc in documents:
-            self.save(doc, **kwargs)
+        map_concurrently(lambda doc: self.save(doc, **kwargs), documents, self.batch_max_workers)
 
 
     @abc.abstractmethod
@@ -74,7 +115,7 @@ class BaseDocumentStore(abc.ABC):
             NotImplementedError: 如果子类不支持批处理。
         """
         # 默认实现是逐个调用 get
-        return [self.get(doc_id, **kwargs) for doc_id in doc_ids]
+        return map_concurrently(lambda doc_id: self.get(doc_id, **kwargs), doc_ids, self.batch_max_workers)
 
 
     @abc.abstractmethod
@@ -110,11 +151,7 @@ class BaseDocumentStore(abc.ABC):
             NotImplementedError: 如果子类不支持批处理。
         """
         # 默认实现是逐个调用 delete
-        count = 0
-        for doc_id in doc_ids:
-            if self.delete(doc_id, **kwargs):
-                count += 1
-        return count
+        return sum(map_concurrently(lambda doc_id: bool(self.delete(doc_id, **kwargs)), doc_ids, self.batch_max_workers))
 
     # 可以添加其他查询方法，例如根据 metadata 查询等
     def find(self, query: Dict[str, Any], **kwargs) -> List[Document]:
@@ -132,4 +169,16 @@ class BaseDocumentStore(abc.ABC):
             StorageError: 如果查询失败。
             NotImplementedError: 如果子类不支持此方法。
         """
-        raise NotImplementedError(f"{self.__class__.__name__} 不支持 find 方法。")
\ No newline at end of file
+        # 默认实现: 用编译后的谓词扫描 _all() 返回的全部文档，适用于内存等小型存储
+        predicate = _compile_query(query)
+        return [doc for doc in self._all(**kwargs) if predicate(doc)]
+
+    def _all(self, **kwargs) -> Iterable[Document]:
+        """
+        遍历存储中的全部文档，供默认的 find 实现使用 (可选)。
+        支持原生查询的后端应直接覆盖 find。
+
+        Raises:
+            NotImplementedError: 如果子类不支持遍历 (此时 find 同样不可用)。
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} 不支持 find 方法。")
@@ -1,8 +1,9 @@
 # src/scrsit/core/interfaces/base_embedder.py
 import abc
-from typing import List, Union
+from typing import List, Optional, Union, cast
 
 from src.scrsit.core.document.models import Chunk, Document, Entity # 等需要 Embedding 的对象
+from src.scrsit.core.exceptions import EmbeddingError
 
 EmbeddableContentType = Union[str, List[str], Chunk, List[Chunk], Document] # 可扩展
 
@@ -11,6 +12,8 @@ class BaseEmbedder(abc.ABC):
     Embedding 生成器接口定义。
     负责为文本或其他内容生成向量表示。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def embed(self, content: EmbeddableContentType, **kwargs) -> Union[List[float], List[List[float]]]:
         """
@@ -37,4 +40,49 @@ class BaseEmbedder(abc.ABC):
         """
         返回 Embedding 向量的维度。
         """
-        pass
\ No newline at end of file
+        pass
+
+    def estimate_tokens(self, text: str) -> int:
+        """
+        粗略估计文本的 token 数，供 embed_batched 分桶使用。
+        默认按约 4 字符/token 估算，子类可按实际 tokenizer 覆盖。
+        """
+        return len(text) // 4 + 1
+
+    def embed_batched(self, texts: List[str], max_tokens: int = 8192, **kwargs) -> List[List[float]]:
+        """
+        按长度分桶批量生成 Embedding (可选优化)。
+        先按估计 token 数降序排序，再贪心打包，使每批估计 token 总数不超过 max_tokens，
+        长度相近的文本同批可减少 padding 浪费；结果按输入顺序返回。
+
+        Args:
+            texts (List[str]): 需要生成 Embedding 的文本列表。
+            max_tokens (int): 每批估计 token 总数的上限。单条超过上限的文本单独成批。
+            **kwargs: 透传给 embed 的参数。
+
+        Returns:
+            List[List[float]]: Embedding 向量列表，顺序与输入对应。
+
+        Raises:
+            EmbeddingError: 如果生成 Embedding 过程中发生错误。
+        """
+        lengths = [self.estimate_tokens(t) for t in texts]
+        order = sorted(range(len(texts)), key=lengths.__getitem__, reverse=True)
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        batch: List[int] = []
+        budget = 0
+        for idx in order + [None]: # None 作为结束哨兵，冲刷最后一批
+            if batch and (idx is None or budget + lengths[idx] > max_tokens):
+                vectors = self.embed([texts[i] for i in batch], **kwargs)
+                if len(vectors) != len(batch):
+                    raise EmbeddingError(
+                        getattr(self, "plugin_name", self.__class__.__name__),
+                        f"embed 返回了 {len(vectors)} 个向量，期望 {len(batch)} 个。",
+                    )
+                for i, vector in zip(batch, vectors):
+                    results[i] = vector
+                batch, budget = [], 0
+            if idx is not None:
+                batch.append(idx)
+                budget += lengths[idx]
+        return cast(List[List[float]], results) # 每个位置都已由所在批次填充
@@ -2,11 +2,15 @@
 import abc
 from typing import List, Dict, Any
 
+from src.scrsit.core.exceptions import ProviderError # 导入共享的异常类
+
 class BaseKnowledgeProvider(abc.ABC):
     """
     知识提供者接口定义。
     用于访问和查询领域知识、行业规范、合规规则等。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def query(self, topic: str, context: Dict[str, Any] = None, **kwargs) -> List[Dict[str, Any]]:
         """
@@ -24,6 +28,4 @@ class BaseKnowledgeProvider(abc.ABC):
         Raises:
             ProviderError: 如果查询知识库失败。
         """
-        pass
-
-from src.scrsit.core.interfaces.base_llm_provider import ProviderError # 导入共享的异常类
\ No newline at end of file
+        pass
\ No newline at end of file
@@ -2,11 +2,14 @@
 import abc
 from typing import List, Dict, Any, AsyncGenerator, Generator
 
+from src.scrsit.core.exceptions import ProviderError # 使用核心定义的 ProviderError，避免重复定义
+
 class BaseLLMProvider(abc.ABC):
     """
     大型语言模型 (LLM) 提供者接口定义。
     封装与 LLM API 或本地模型的交互。
     """
+    __slots__ = ()
 
     @abc.abstractmethod
     def generate(self, prompt: str, **kwargs) -> str:
@@ -78,8 +81,4 @@ class BaseLLMProvider(abc.ABC):
         if False: # pragma: no cover
             yield # pragma: no cover
 
-    # 可以添加其他方法，如计算 token 数量等
-
-class ProviderError(Exception):
-    """与外部 AI Provider (LLM, OCR 等) 交互时发生的错误基类。"""
-    pass
\ No newline at end of file
+    # 可以添加其他方法，如计算 token 数量等
\ No newline at end of file
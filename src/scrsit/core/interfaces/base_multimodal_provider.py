@@ -2,6 +2,8 @@
 import abc
 from typing import List, Dict, Any, Union
 
+from src.scrsit.core.exceptions import ProviderError # 导入共享的异常类
+
 # 定义多模态输入类型 (示例)
 MultimodalInput = List[Dict[str, Union[str, bytes]]] # 例如 [{'type': 'text', 'content': '...'}, {'type': 'image', 'content': b'...'}]
 
@@ -10,6 +12,8 @@ class BaseMultimodalProvider(abc.ABC):
     多模态模型提供者接口定义。
     处理包含多种类型内容（如文本和图像）的输入。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def process(self, inputs: MultimodalInput, **kwargs) -> Any:
         """
@@ -31,6 +35,4 @@ class BaseMultimodalProvider(abc.ABC):
     @abc.abstractmethod
     async def aprocess(self, inputs: MultimodalInput, **kwargs) -> Any:
         """异步版本的 process。"""
-        pass
-
-from src.scrsit.core.interfaces.base_llm_provider import ProviderError # 导入共享的异常类
\ No newline at end of file
+        pass
\ No newline at end of file
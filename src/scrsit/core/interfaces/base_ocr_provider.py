@@ -1,18 +1,91 @@
 # src/scrsit/core/interfaces/base_ocr_provider.py
-import abc, logging
-from typing import Union, List
+import abc, hashlib, logging, os, threading, weakref
+from collections import OrderedDict
+from typing import Union, List, Optional, Dict, Any
 from PIL import Image # 使用 PIL 处理图片
 
-from src.scrsit.core.interfaces.base_llm_provider import ProviderError # 导入共享的异常类
+from src.scrsit.core.exceptions import ProviderError # 导入共享的异常类
+from src.scrsit.core.utils.helpers import map_concurrently
 
 logger = logging.getLogger(__name__)
 
+# PIL 图片按行条带分段哈希，每段约 1 MiB，避免为计算缓存键复制整幅解码后的像素缓冲区
+_PIL_HASH_STRIP_BYTES = 1 << 20
+
+
+def _pil_image_digest(image: Image.Image) -> str:
+    """分条带哈希 PIL 图片的模式、尺寸、调色板和像素数据。"""
+    h = hashlib.blake2b(f"{image.mode}:{image.size}:".encode(), digest_size=16)
+    if image.mode == "P":
+        h.update(bytes(image.getpalette() or ()))
+    width, height = image.size
+    rows = max(1, _PIL_HASH_STRIP_BYTES // max(1, width * len(image.getbands())))
+    for top in range(0, height, rows):
+        h.update(image.crop((0, top, width, min(top + rows, height))).tobytes())
+    return h.hexdigest()
+
+
+def _image_digest(image: Union[bytes, str, Image.Image]) -> Optional[str]:
+    """
+    计算图片内容的摘要，用作 OCR 结果缓存的键。
+    bytes 直接哈希；PIL Image 分条带哈希像素数据；
+    文件路径使用路径 + 修改时间 + 大小 (不读取文件)。无法计算时返回 None (不缓存)。
+    """
+    if isinstance(image, (bytes, bytearray, memoryview)):
+        return hashlib.blake2b(image, digest_size=16).hexdigest()
+    if isinstance(image, Image.Image):
+        return _pil_image_digest(image)
+    if isinstance(image, (str, os.PathLike)):
+        try:
+            st = os.stat(image)
+        except OSError:
+            return None
+        return f"path:{os.fspath(image)}:{st.st_mtime_ns}:{st.st_size}"
+    return None
+
+
+class _OCRResultCache:
+    """单个 OCR 提供者的结果缓存 (LRU) 及其命中统计，二者总是一起创建。"""
+    __slots__ = ("entries", "hits", "misses", "lock")
+
+    def __init__(self):
+        self.entries: "OrderedDict[Any, str]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+
+# 提供者实例 -> 结果缓存。缓存不作为实例属性存放 (接口类 __slots__ 为空，需能与其他插件基类混用)，
+# 提供者被回收时其缓存随之释放
+_ocr_caches: "weakref.WeakKeyDictionary[Any, _OCRResultCache]" = weakref.WeakKeyDictionary()
+_ocr_caches_lock = threading.Lock()
+
+
+def _get_ocr_cache(provider: Any, create: bool) -> Optional[_OCRResultCache]:
+    """返回提供者的结果缓存；provider 不支持弱引用或不可哈希时返回 None (不缓存)。"""
+    with _ocr_caches_lock:
+        try:
+            cache = _ocr_caches.get(provider)
+            if cache is None and create:
+                cache = _ocr_caches[provider] = _OCRResultCache()
+        except TypeError:
+            return None
+    return cache
+
 
 class BaseOCRProvider(abc.ABC):
     """
     光学字符识别 (OCR) 提供者接口定义。
     负责从图片中提取文本。
     """
+    __slots__ = ()
+
+    # extract_text_batch 默认实现的并发线程数。默认 1 (串行)；extract_text 线程安全且受 I/O 限制
+    # (例如远程 OCR 服务) 时可调大
+    batch_max_workers: int = 1
+    # extract_text_cached 按图片内容缓存的最大条目数 (LRU)。默认 0 (不缓存)，需要时由子类或实例开启
+    ocr_cache_size: int = 0
+
     @abc.abstractmethod
     def extract_text(self, image: Union[bytes, str, Image.Image], **kwargs) -> str:
         """
@@ -45,14 +118,58 @@ class BaseOCRProvider(abc.ABC):
             ProviderError: 如果 OCR 处理失败。
             NotImplementedError: 如果子类不支持批处理。
         """
-        # 默认实现是逐个调用 extract_text
-        results = []
-        for img in images:
+        # 默认实现是逐个调用 extract_text_cached；开启缓存 (ocr_cache_size > 0) 后，
+        # 批内及跨批次的重复图片 (页眉、模板页、重复处理) 直接命中缓存
+        def _extract(img) -> str:
             try:
-                results.append(self.extract_text(img, **kwargs))
+                return self.extract_text_cached(img, **kwargs)
             except Exception as e:
                 # 根据需要决定是记录错误继续，还是直接抛出
                 logging.error(f"处理图片时出错: {e}", exc_info=True)
-                results.append("") # 或抛出异常
-        return results
+                return "" # 或抛出异常
+        return map_concurrently(_extract, images, self.batch_max_workers)
+
+    def extract_text_cached(self, image: Union[bytes, str, Image.Image], **kwargs) -> str:
+        """
+        带缓存的 extract_text: 以图片内容摘要和 kwargs 为键缓存识别结果 (进程内 LRU)。
+        ocr_cache_size 为 0 (默认) 或无法为该图片/提供者缓存时，等同于直接调用 extract_text。
+
+        Args:
+            image (Union[bytes, str, Image.Image]): 图片的二进制数据、文件路径或 PIL Image 对象。
+            **kwargs: OCR 提供者的特定参数，参与缓存键 (例如不同 language 分别缓存)。
+
+        Returns:
+            str: 提取出的文本内容。
+
+        Raises:
+            ProviderError: 如果 OCR 处理失败 (失败结果不缓存)。
+        """
+        if self.ocr_cache_size <= 0:
+            return self.extract_text(image, **kwargs)
+        digest = _image_digest(image)
+        cache = _get_ocr_cache(self, create=True) if digest is not None else None
+        if cache is None:
+            return self.extract_text(image, **kwargs)
+
+        key = (digest, tuple(sorted((k, repr(v)) for k, v in kwargs.items())))
+        with cache.lock:
+            text = cache.entries.get(key)
+            if text is not None:
+                cache.entries.move_to_end(key)
+                cache.hits += 1
+                return text
+            cache.misses += 1
+        text = self.extract_text(image, **kwargs)
+        with cache.lock:
+            cache.entries[key] = text
+            while len(cache.entries) > self.ocr_cache_size:
+                cache.entries.popitem(last=False)
+        return text
 
+    def cache_stats(self) -> Dict[str, Any]:
+        """返回 OCR 结果缓存的命中/未命中次数和当前条目数。"""
+        cache = _get_ocr_cache(self, create=False)
+        if cache is None:
+            return {"hits": 0, "misses": 0, "size": 0}
+        with cache.lock:
+            return {"hits": cache.hits, "misses": cache.misses, "size": len(cache.entries)}
@@ -9,6 +9,8 @@ class BaseParser(abc.ABC):
     文档解析器接口定义。
     负责将不同格式的原始文档文件解析为统一的 Document 对象。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def parse(self, file_source: Union[str, IO[bytes]], **kwargs) -> Document:
         """
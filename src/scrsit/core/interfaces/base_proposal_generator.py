@@ -4,6 +4,7 @@ from typing import Dict, Any, List, Optional
 from pydantic import BaseModel
 
 from src.scrsit.core.document.models import Document # 或其他表示需求的数据结构
+from src.scrsit.core.exceptions import WorkflowError
 
 class ChangeProposal(BaseModel):
     """变更提议的数据模型。"""
@@ -18,6 +19,8 @@ class BaseProposalGenerator(abc.ABC):
     变更提议生成器接口定义。
     根据评审结果或需求差异，生成具体的修改建议。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def generate_proposals(self, context: Dict[str, Any], **kwargs) -> List[ChangeProposal]:
         """
@@ -35,5 +38,3 @@ class BaseProposalGenerator(abc.ABC):
             WorkflowError: 如果生成提议过程中发生错误。
         """
         pass
-
-from src.scrsit.core.exceptions import WorkflowError
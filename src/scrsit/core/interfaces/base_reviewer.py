@@ -4,6 +4,7 @@ from typing import Dict, Any, List, Optional, Union
 from pydantic import BaseModel, Field
 
 from src.scrsit.core.document.models import Document # 或其他表示需求的数据结构
+from src.scrsit.core.exceptions import WorkflowError
 
 class ReviewResult(BaseModel):
     """评审结果的数据模型。"""
@@ -19,6 +20,8 @@ class BaseReviewer(abc.ABC):
     需求评审器接口定义。
     负责根据特定规则或模型评审需求的质量（完整性、一致性、清晰度等）。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def review(self, requirement_data: Union[Document, Dict[str, Any]], criteria: Dict[str, Any] = None, **kwargs) -> ReviewResult:
         """
@@ -36,5 +39,3 @@ class BaseReviewer(abc.ABC):
             WorkflowError: 如果评审过程中发生错误。
         """
         pass
-
-from src.scrsit.core.exceptions import WorkflowError
\ No newline at end of file
@@ -2,6 +2,8 @@
 import abc
 from typing import List, Dict, Any, Optional
 
+from src.scrsit.core.utils.helpers import map_concurrently
+
 # 可以定义具体的结构化数据模型，或者使用通用字典
 StructuredData = Dict[str, Any]
 
@@ -10,6 +12,11 @@ class BaseStructuredStore(abc.ABC):
     结构化数据存储接口定义。
     用于存储和查询分析结果、元数据、关系等结构化信息 (例如，存储 Entities, Relationships)。
     """
+    __slots__ = ()
+
+    # save_batch/get_batch 默认实现逐条调用时的并发线程数，含义同 BaseDocumentStore.batch_max_workers
+    batch_max_workers: int = 1
+
     @abc.abstractmethod
     def save(self, collection: str, data: StructuredData, **kwargs) -> str:
         """
@@ -46,7 +53,7 @@ class BaseStructuredStore(abc.ABC):
             NotImplementedError: 如果子类不支持批处理。
         """
         # 默认实现是逐个调用 save
-        return [self.save(collection, data, **kwargs) for data in data_list]
+        return map_concurrently(lambda data: self.save(collection, data, **kwargs), data_list, self.batch_max_workers)
 
     @abc.abstractmethod
     def get(self, collection: str, record_id: str, **kwargs) -> Optional[StructuredData]:
@@ -66,6 +73,26 @@ class BaseStructuredStore(abc.ABC):
         """
         pass
 
+    def get_batch(self, collection: str, record_ids: List[str], **kwargs) -> List[Optional[StructuredData]]:
+        """
+        根据 ID 列表从指定集合/表中批量检索记录 (可选优化)。
+
+        Args:
+            collection (str): 目标集合或表的名称。
+            record_ids (List[str]): 要检索的记录 ID 列表。
+            **kwargs: 特定于存储后端的参数。
+
+        Returns:
+            List[Optional[StructuredData]]: 找到的记录列表，顺序与输入 ID 对应，
+                                            对于不存在的 ID，对应位置为 None。
+
+        Raises:
+            StorageError: 如果检索失败。
+            NotImplementedError: 如果子类不支持批处理。
+        """
+        # 默认实现是逐个调用 get
+        return map_concurrently(lambda record_id: self.get(collection, record_id, **kwargs), record_ids, self.batch_max_workers)
+
     @abc.abstractmethod
     def find(self, collection: str, query: Dict[str, Any], **kwargs) -> List[StructuredData]:
         """
@@ -1,6 +1,7 @@
 # src/scrsit/core/interfaces/base_vector_store.py
 import abc
-from typing import List, Tuple, Optional, Dict, Any
+import heapq
+from typing import List, Tuple, Optional, Dict, Any, Sequence
 from pydantic import BaseModel # 用于定义结果类
 
 from src.scrsit.core.document.models import Chunk # 通常存储 Chunk 的 Embedding
@@ -15,6 +16,8 @@ class BaseVectorStore(abc.ABC):
     向量存储接口定义。
     负责存储、检索和管理向量 Embedding 及其关联的元数据（通常是 Chunk）。
     """
+    __slots__ = ()
+
     @abc.abstractmethod
     def add_embeddings(self, chunks: List[Chunk], embeddings: List[List[float]], **kwargs) -> List[str]:
         """
@@ -56,6 +59,37 @@ class BaseVectorStore(abc.ABC):
         """
         pass
 
+    @staticmethod
+    def _topk(scores: Sequence[float], k: int) -> List[int]:
+        """
+        返回得分最高的 k 个下标，按得分降序排列。
+        推荐在默认/内存实现的 search 中使用：heapq.nlargest 为 O(N log k)，
+        而 sorted(..., reverse=True)[:k] 需要对全部 N 个得分排序。
+        """
+        if k <= 0:
+            return []
+        return heapq.nlargest(k, range(len(scores)), key=scores.__getitem__)
+
+    def search_batch(self, query_embeddings: List[List[float]], top_k: int = 5, filter: Optional[Dict[str, Any]] = None, **kwargs) -> List[List[VectorStoreQueryResult]]:
+        """
+        批量相似性搜索 (可选优化)。
+
+        Args:
+            query_embeddings (List[List[float]]): 查询 Embedding 向量列表。
+            top_k (int): 每个查询返回最相似结果的数量。
+            filter (Optional[Dict[str, Any]]): 应用于所有查询的元数据过滤条件。
+            **kwargs: 特定于存储后端的参数。
+
+        Returns:
+            List[List[VectorStoreQueryResult]]: 每个查询的结果列表，顺序与输入查询对应。
+
+        Raises:
+            StorageError: 如果搜索失败。
+        """
+        # 默认实现是逐个调用 search。后端有原生批量查询接口 (FAISS, Milvus, Qdrant 等) 时
+        # 应覆盖此方法，一次调用计算全部查询的距离矩阵
+        return [self.search(q, top_k=top_k, filter=filter, **kwargs) for q in query_embeddings]
+
     @abc.abstractmethod
     def delete_by_ids(self, chunk_ids: List[str], **kwargs) -> bool:
         """
@@ -7,8 +7,8 @@
 """
 import logging
 import importlib.metadata
-from typing import Type, Dict, List, Optional, TypeVar, Generic, cast, Any
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Type, Dict, List, Optional, TypeVar, Generic, cast, Any, Callable
 
 from src.scrsit.core.config.settings import AppSettings, get_settings
 from src.scrsit.core.exceptions import (
@@ -45,10 +45,17 @@ PLUGIN_GROUPS = {
     "proposal_generators": BaseProposalGenerator,
 }
 
+# 接口类型 -> 插件组名称的反向映射，供按接口查找组名时使用
+_INTERFACE_TO_GROUP: Dict[Type, str] = {v: k for k, v in PLUGIN_GROUPS.items()}
+
 class PluginManager:
     """
     管理应用中的所有插件。
     """
+    # importlib.metadata.entry_points() 的结果 (进程级缓存)。每次调用都会重新扫描全部已安装发行包的元数据，
+    # 因此只扫描一次，再按组 select；安装新插件后可调用 clear_entry_points_cache() 重新扫描
+    _entry_points_cache: Optional[importlib.metadata.EntryPoints] = None
+
     def __init__(self, settings: Optional[AppSettings] = None):
         """
         初始化插件管理器。
@@ -57,55 +64,160 @@ class PluginManager:
             settings (Optional[AppSettings]): 应用配置。如果为 None，则尝试加载全局配置。
         """
         self.settings = settings or get_settings()
-        self._plugins: Dict[Type, Dict[str, Type]] = defaultdict(dict) # {InterfaceType: {plugin_name: PluginClass}}
-        self._instances: Dict[Type, Dict[str, Any]] = defaultdict(dict) # {InterfaceType: {plugin_name: PluginInstance}}
+        # 每种接口预先建好内层字典，查找时直接索引，无需 defaultdict 工厂或临时空字典
+        self._entry_points: Dict[Type, Dict[str, importlib.metadata.EntryPoint]] = {cls: {} for cls in PLUGIN_GROUPS.values()} # {InterfaceType: {plugin_name: EntryPoint}}
+        self._plugins: Dict[Type, Dict[str, Type]] = {cls: {} for cls in PLUGIN_GROUPS.values()} # {InterfaceType: {plugin_name: PluginClass}} (已导入的插件类)
+        self._instances: Dict[Type, Dict[str, Any]] = {cls: {} for cls in PLUGIN_GROUPS.values()} # {InterfaceType: {plugin_name: PluginInstance}}
         self._load_all_plugins()
+        self._default_names: Dict[Type, str] = self._resolve_default_names() # {InterfaceType: default_plugin_name}
 
     def _load_all_plugins(self):
         """
-        发现并加载所有在 pyproject.toml 中声明的插件。
+        发现所有在 pyproject.toml 中声明的插件。
+        默认只登记入口点，插件类在首次获取时才导入；settings.eager_plugin_load 为 True 时立即导入全部插件类。
         """
-        logger.info("开始加载所有插件...")
+        logger.info("开始发现所有插件...")
+        try:
+            all_entry_points = self._get_entry_points()
+        except Exception as e:
+            logger.warning("无法获取插件入口点: %s", e, exc_info=True)
+            return
+
         for group_name, interface_cls in PLUGIN_GROUPS.items():
             entry_point_group = f"scrsit.{group_name}"
             try:
-                entry_points = importlib.metadata.entry_points(group=entry_point_group)
+                entry_points = all_entry_points.select(group=entry_point_group)
             except Exception as e:
-                logger.warning(f"无法获取插件组 '{entry_point_group}' 的入口点: {e}", exc_info=True)
+                logger.warning("无法获取插件组 '%s' 的入口点: %s", entry_point_group, e, exc_info=True)
                 continue
 
             if not entry_points:
-                 logger.debug(f"在组 '{entry_point_group}' 中未找到插件入口点。")
+                 logger.debug("在组 '%s' 中未找到插件入口点。", entry_point_group)
                  continue
 
-            logger.info(f"在组 '{entry_point_group}' 中发现 {len(entry_points)} 个入口点。")
+            logger.info("在组 '%s' 中发现 %s 个入口点。", entry_point_group, len(entry_points))
 
             for ep in entry_points:
-                plugin_name = ep.name
+                self._entry_points[interface_cls][ep.name] = ep
+
+        if self.settings.eager_plugin_load:
+            pending = [
+                (interface_cls, plugin_name, ep)
+                for interface_cls, entry_points in self._entry_points.items()
+                for plugin_name, ep in entry_points.items()
+            ]
+            if self.settings.parallel_plugin_load and len(pending) > 1:
+                # 只在线程池中执行 ep.load()，接口校验与注册仍在当前线程完成，无需加锁
+                with ThreadPoolExecutor(max_workers=min(8, len(pending))) as pool:
+                    futures = [(interface_cls, plugin_name, pool.submit(ep.load)) for interface_cls, plugin_name, ep in pending]
+                # future.result 会返回导入的类，或重新抛出导入时的异常 (在 _load_plugin_class 中统一处理)
+                loads = [(interface_cls, plugin_name, future.result) for interface_cls, plugin_name, future in futures]
+            else:
+                loads = [(interface_cls, plugin_name, None) for interface_cls, plugin_name, _ in pending]
+            for interface_cls, plugin_name, load in loads:
                 try:
-                    plugin_class = ep.load()
-                    logger.debug(f"成功加载插件 '{plugin_name}' (类: {plugin_class.__name__}) 从入口点 '{ep.value}'。")
+                    self._load_plugin_class(interface_cls, plugin_name, load)
+                except PluginLoadError:
+                    # 错误已在 _load_plugin_class 中记录，跳过此插件继续加载其他插件
+                    continue
+            logger.info("所有插件加载完成。")
+        else:
+            logger.info("插件发现完成，插件类将在首次使用时加载。")
 
-                    # 验证插件是否实现了预期的接口
-                    if not issubclass(plugin_class, interface_cls):
-                        logger.error(
-                            f"插件 '{plugin_name}' (类: {plugin_class.__name__}) "
-                            f"未实现预期的接口 '{interface_cls.__name__}'。将跳过此插件。"
-                        )
-                        continue
+    def _load_plugin_class(self, interface_cls: Type[T], plugin_name: str, load: Optional[Callable[[], Any]] = None) -> Type[T]:
+        """
+        导入 (或返回已缓存的) 插件类，并验证其实现了预期的接口。
+        load 用于替代 ep.load() 取得插件类 (例如并发预加载时返回已完成的导入结果)。
 
-                    if hasattr(plugin_class, 'plugin_name'):
-                         plugin_class.plugin_name = plugin_name # 将插件名称注入类中（如果需要）
+        Raises:
+            PluginNotFoundError: 如果没有发现该名称的插件。
+            PluginLoadError: 如果导入失败或插件未实现预期的接口 (该插件随后不再可用)。
+        """
+        plugin_class = self._plugins[interface_cls].get(plugin_name)
+        if plugin_class is not None:
+            return plugin_class
 
-                    self._plugins[interface_cls][plugin_name] = plugin_class
-                    logger.info(f"已注册插件 '{plugin_name}' (类型: {interface_cls.__name__})。")
+        ep = self._entry_points[interface_cls].get(plugin_name)
+        if ep is None:
+            raise PluginNotFoundError(interface_cls.__name__, plugin_name)
+
+        try:
+            plugin_class = (load or ep.load)()
+            logger.debug("成功加载插件 '%s' (类: %s) 从入口点 '%s'。", plugin_name, plugin_class.__name__, ep.value)
+
+            # 验证插件是否实现了预期的接口
+            if not issubclass(plugin_class, interface_cls):
+                raise TypeError(
+                    f"插件 '{plugin_name}' (类: {plugin_class.__name__}) "
+                    f"未实现预期的接口 '{interface_cls.__name__}'。"
+                )
+        except Exception as e:
+            logger.error("加载插件 '%s' 从入口点 '%s' 时出错: %s", plugin_name, ep.value, e, exc_info=True)
+            # 加载失败的插件不再保留，避免每次获取时重复导入
+            del self._entry_points[interface_cls][plugin_name]
+            raise PluginLoadError(plugin_name, e) from e
 
-                except Exception as e:
-                    logger.error(f"加载插件 '{plugin_name}' 从入口点 '{ep.value}' 时出错: {e}", exc_info=True)
-                    # 可以选择抛出 PluginLoadError 或仅记录错误并继续
-                    # raise PluginLoadError(ep.value, e) from e
+        if hasattr(plugin_class, 'plugin_name'):
+             plugin_class.plugin_name = plugin_name # 将插件名称注入类中（如果需要）
 
-        logger.info("所有插件加载完成。")
+        self._plugins[interface_cls][plugin_name] = plugin_class
+        logger.info("已注册插件 '%s' (类型: %s)。", plugin_name, interface_cls.__name__)
+        return plugin_class
+
+    def _resolve_default_names(self) -> Dict[Type, str]:
+        """
+        为每种插件接口解析一次配置中的默认插件名称 (插件发现后、首次获取插件前调用)。
+        未配置默认值的接口由 _fallback_default_name 在首次需要时再确定。
+        """
+        default_names: Dict[Type, str] = {}
+        for plugin_type_key, interface_cls in PLUGIN_GROUPS.items():
+            # 特殊处理存储类插件的名称获取
+            if plugin_type_key == "document_stores":
+                default_plugin_name = self.settings.document_store_name
+            elif plugin_type_key == "vector_stores":
+                default_plugin_name = self.settings.vector_store_name
+            elif plugin_type_key == "structured_stores":
+                default_plugin_name = self.settings.structured_store_name
+            else:
+                # 通用获取默认插件名称的逻辑 (例如 default_parser, default_embedder)
+                default_attr_name = f"default_{plugin_type_key[:-1]}" # e.g., default_parser
+                default_plugin_name = getattr(self.settings, default_attr_name, None)
+
+            if default_plugin_name:
+                default_names[interface_cls] = default_plugin_name
+        return default_names
+
+    def _fallback_default_name(self, interface_cls: Type) -> Optional[str]:
+        """
+        未配置默认插件时，如果该类型只有一个可成功加载的插件，则将其用作默认 (结果会被缓存)。
+        插件类是延迟加载的，因此这里需要实际加载候选插件，加载失败的插件不计入。
+        """
+        loadable = []
+        for plugin_name in list(self._entry_points.get(interface_cls, {})):
+            try:
+                self._load_plugin_class(interface_cls, plugin_name)
+            except PluginLoadError:
+                continue # 错误已在 _load_plugin_class 中记录
+            loadable.append(plugin_name)
+
+        if len(loadable) != 1:
+            return None
+        default_plugin_name = loadable[0]
+        logger.info("未配置默认 %s，但只找到一个已注册插件 '%s'，将其用作默认。", interface_cls.__name__, default_plugin_name)
+        self._default_names[interface_cls] = default_plugin_name
+        return default_plugin_name
+
+    @classmethod
+    def _get_entry_points(cls) -> importlib.metadata.EntryPoints:
+        """返回 (缓存的) 全部已安装入口点。"""
+        if cls._entry_points_cache is None:
+            cls._entry_points_cache = importlib.metadata.entry_points()
+        return cls._entry_points_cache
+
+    @classmethod
+    def clear_entry_points_cache(cls) -> None:
+        """清除入口点缓存，下次加载插件时重新扫描已安装的发行包。"""
+        cls._entry_points_cache = None
 
     def _get_plugin_config(self, plugin_type: str, plugin_name: str) -> Dict[str, Any]:
         """获取特定插件的配置字典。"""
@@ -130,19 +242,19 @@ class PluginManager:
                  return {}
 
         # 如果没有找到特定配置，返回空字典
-        logger.debug(f"未找到插件 '{plugin_name}' (类型: {plugin_type}) 的特定配置，将使用默认值。")
+        logger.debug("未找到插件 '%s' (类型: %s) 的特定配置，将使用默认值。", plugin_name, plugin_type)
         return {}
 
     def _get_instance(self, interface_cls: Type[T], plugin_name: str) -> T:
         """获取或创建插件实例。"""
-        if plugin_name in self._instances.get(interface_cls, {}):
-            return cast(T, self._instances[interface_cls][plugin_name])
-
-        if plugin_name not in self._plugins.get(interface_cls, {}):
+        instances = self._instances.get(interface_cls)
+        if instances is None: # 不是已知的插件接口类型
             raise PluginNotFoundError(interface_cls.__name__, plugin_name)
+        if plugin_name in instances:
+            return cast(T, instances[plugin_name])
 
-        plugin_class = self._plugins[interface_cls][plugin_name]
-        plugin_type_key = next((k for k, v in PLUGIN_GROUPS.items() if v == interface_cls), None)
+        plugin_class = self._load_plugin_class(interface_cls, plugin_name)
+        plugin_type_key = _INTERFACE_TO_GROUP.get(interface_cls)
 
         if not plugin_type_key:
              # 这理论上不应该发生，因为 interface_cls 来自 PLUGIN_GROUPS
@@ -151,7 +263,7 @@ class PluginManager:
         config = self._get_plugin_config(plugin_type_key, plugin_name)
 
         try:
-            logger.info(f"正在创建插件 '{plugin_name}' (类型: {interface_cls.__name__}) 的实例...")
+            logger.info("正在创建插件 '%s' (类型: %s) 的实例...", plugin_name, interface_cls.__name__)
             # 假设插件构造函数接受 config 字典
             instance = plugin_class(config=config)
 
@@ -160,19 +272,19 @@ class PluginManager:
                  try:
                      instance.validate_config()
                  except Exception as e:
-                     logger.error(f"插件 '{plugin_name}' 的配置验证失败: {e}", exc_info=True)
-                     raise PluginConfigurationError(f"插件 '{plugin_name}' 配置无效: {e}") from e
+                     logger.error("插件 '%s' 的配置验证失败: %s", plugin_name, e, exc_info=True)
+                     raise PluginConfigurationError(plugin_name, f"配置无效: {e}") from e
 
-            self._instances[interface_cls][plugin_name] = instance
-            logger.info(f"插件 '{plugin_name}' (类型: {interface_cls.__name__}) 实例创建成功。")
+            instances[plugin_name] = instance
+            logger.info("插件 '%s' (类型: %s) 实例创建成功。", plugin_name, interface_cls.__name__)
             return cast(T, instance)
         except Exception as e:
-            logger.exception(f"创建插件 '{plugin_name}' 实例时出错: {e}", exc_info=True)
+            logger.exception("创建插件 '%s' 实例时出错: %s", plugin_name, e)
             # 区分是配置错误还是其他实例化错误
             if isinstance(e, (PluginConfigurationError, ConfigurationError)):
                 raise
             else:
-                raise PluginLoadError(f"插件 '{plugin_name}' 实例化失败", e) from e
+                raise PluginLoadError(plugin_name, e) from e
 
 
     def get_plugin(self, interface_cls: Type[T], name: Optional[str] = None) -> T:
@@ -193,35 +305,14 @@ class PluginManager:
         """
         if name:
             return self._get_instance(interface_cls, name)
-        else:
-            # 获取默认插件名称
-            default_plugin_name = None
-            plugin_type_key = next((k for k, v in PLUGIN_GROUPS.items() if v == interface_cls), None)
-
-            if plugin_type_key:
-                # 特殊处理存储类插件的名称获取
-                if plugin_type_key == "document_stores":
-                    default_plugin_name = self.settings.document_store_name
-                elif plugin_type_key == "vector_stores":
-                    default_plugin_name = self.settings.vector_store_name
-                elif plugin_type_key == "structured_stores":
-                    default_plugin_name = self.settings.structured_store_name
-                else:
-                    # 通用获取默认插件名称的逻辑 (例如 default_parser, default_embedder)
-                    default_attr_name = f"default_{plugin_type_key[:-1]}" # e.g., default_parser
-                    default_plugin_name = getattr(self.settings, default_attr_name, None)
-
-            if not default_plugin_name:
-                # 如果只有一个该类型的插件被注册，可以将其作为默认
-                available_plugins = self._plugins.get(interface_cls, {})
-                if len(available_plugins) == 1:
-                     default_plugin_name = list(available_plugins.keys())[0]
-                     logger.info(f"未配置默认 {interface_cls.__name__}，但只找到一个已注册插件 '{default_plugin_name}'，将其用作默认。")
-                else:
-                    raise ConfigurationError(f"未指定插件名称，且无法确定接口 '{interface_cls.__name__}' 的默认插件。请在配置中设置默认值或显式指定名称。可用插件: {list(available_plugins.keys())}")
-
-            logger.debug(f"获取接口 '{interface_cls.__name__}' 的默认插件: '{default_plugin_name}'")
-            return self._get_instance(interface_cls, default_plugin_name)
+
+        default_plugin_name = self._default_names.get(interface_cls) or self._fallback_default_name(interface_cls)
+        if not default_plugin_name:
+            available_plugins = self._entry_points.get(interface_cls, {})
+            raise ConfigurationError(f"未指定插件名称，且无法确定接口 '{interface_cls.__name__}' 的默认插件。请在配置中设置默认值或显式指定名称。可用插件: {list(available_plugins.keys())}")
+
+        logger.debug("获取接口 '%s' 的默认插件: '%s'", interface_cls.__name__, default_plugin_name)
+        return self._get_instance(interface_cls, default_plugin_name)
 
     def get_parser(self, file_type: Optional[str] = None, parser_name: Optional[str] = None) -> BaseParser:
         """
@@ -247,10 +338,10 @@ class PluginManager:
             normalized_type = file_type.lower().lstrip('.')
             mapped_name = self.settings.parser_mapping.get(normalized_type)
             if mapped_name:
-                logger.debug(f"根据文件类型 '{normalized_type}' 获取映射的解析器: '{mapped_name}'")
+                logger.debug("根据文件类型 '%s' 获取映射的解析器: '%s'", normalized_type, mapped_name)
                 return self.get_plugin(BaseParser, name=mapped_name)
             else:
-                logger.warning(f"未找到文件类型 '{normalized_type}' 的特定解析器映射，将尝试获取默认解析器。")
+                logger.warning("未找到文件类型 '%s' 的特定解析器映射，将尝试获取默认解析器。", normalized_type)
                 # 没有映射时回退到默认解析器或抛出错误？当前选择回退。
 
         # 获取默认解析器
@@ -295,18 +386,21 @@ class PluginManager:
             try:
                 analyzers.append(self.get_analyzer(name))
             except PluginNotFoundError:
-                logger.warning(f"配置中启用的分析器 '{name}' 未找到，将被忽略。")
+                logger.warning("配置中启用的分析器 '%s' 未找到，将被忽略。", name)
+            except PluginLoadError:
+                # 插件类在首次使用时才加载，加载或实例化失败的分析器同样跳过，不影响其他分析器
+                logger.warning("配置中启用的分析器 '%s' 加载失败，将被忽略。", name)
         return analyzers
 
     # ... 为其他插件类型添加类似的 get_xxx 方法 ...
 
     def list_available_plugins(self) -> Dict[str, List[str]]:
-        """列出所有已发现和加载的插件。"""
-        available = defaultdict(list)
-        for interface_cls, plugins in self._plugins.items():
-            type_key = next((k for k, v in PLUGIN_GROUPS.items() if v == interface_cls), interface_cls.__name__)
-            available[type_key] = sorted(list(plugins.keys()))
-        return dict(available)
+        """列出所有已发现的插件 (包括尚未导入的插件)。"""
+        return {
+            _INTERFACE_TO_GROUP[interface_cls]: sorted(plugins)
+            for interface_cls, plugins in self._entry_points.items()
+            if plugins
+        }
     
 if __name__ == "__main__":
     import sys
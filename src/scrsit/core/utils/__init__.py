@@ -1,4 +1,4 @@
 # src/scrsit/core/utils/__init__.py
 # 核心工具包
 from .logging import setup_logging
-from .helpers import generate_uuid
\ No newline at end of file
+from .helpers import generate_uuid, generate_short_id, map_concurrently
\ No newline at end of file
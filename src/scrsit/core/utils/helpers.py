@@ -3,10 +3,60 @@
 """
 核心通用工具函数或类。
 """
-import uuid
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, List, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 每次从 os.urandom 预取的 UUID 数量，避免每个 ID 都触发一次 getrandom 系统调用
+_UUID_BATCH_SIZE = 256
+_uuid_pool: List[str] = []
+
+def _uuid_batch(n: int) -> List[str]:
+    """
+    一次读取 16*n 字节随机数，生成 n 个 UUID4 字符串。
+    直接在字节上设置 version/variant 位并按 8-4-4-4-12 切分十六进制串，
+    不为每个 ID 构造 uuid.UUID 对象。
+    """
+    rnd = bytearray(os.urandom(16 * n))
+    rnd[6::16] = bytes((b & 0x0F) | 0x40 for b in rnd[6::16]) # version 4
+    rnd[8::16] = bytes((b & 0x3F) | 0x80 for b in rnd[8::16]) # RFC 4122 variant
+    h = rnd.hex()
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-{h[i + 12:i + 16]}-{h[i + 16:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * n, 32)
+    ]
 
 def generate_uuid() -> str:
     """生成一个 UUID 字符串。"""
-    return str(uuid.uuid4())
+    try:
+        return _uuid_pool.pop()
+    except IndexError:
+        _uuid_pool.extend(_uuid_batch(_UUID_BATCH_SIZE))
+        return _uuid_pool.pop()
+
+def generate_short_id() -> str:
+    """生成 16 位十六进制的短 ID (64 位随机数)，用于无需全局唯一的局部标识。"""
+    return os.urandom(8).hex()
+
+# fork 后子进程不能复用父进程预取的随机数，否则会生成重复 ID
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_uuid_pool.clear)
+
+def map_concurrently(func: Callable[[T], R], items: Iterable[T], max_workers: int = 1) -> List[R]:
+    """
+    对 items 逐个调用 func，结果顺序与输入一致。
+    max_workers > 1 时使用线程池并发执行，用于重叠 I/O 等待 (例如逐条访问远程存储)；
+    否则 (或只有一个元素时) 退化为串行调用，不创建线程池。
+    任一调用抛出的异常会原样传播给调用方。
+    """
+    items = list(items)
+    workers = min(max_workers, len(items))
+    if workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, items))
 
-# 可以根据需要添加更多不依赖具体插件实现的通用函数
\ No newline at end of file
+# 可以根据需要添加更多不依赖具体插件实现的通用函数
@@ -1,8 +1,21 @@
 # src/scrsit/core/workflows/__init__.py
 # 核心业务流程/服务编排包
-from ingestion import IngestionWorkflow
-# from analysis import AnalysisWorkflow
-# from retrieval import RetrievalWorkflow
-# from comparison import ComparisonWorkflow
+# 工作流依赖插件管理器及全部接口，首次访问时再导入
+from typing import TYPE_CHECKING
 
-# 可以根据需要导出工作流类
\ No newline at end of file
+if TYPE_CHECKING:
+    from src.scrsit.core.workflows.ingestion import IngestionWorkflow
+
+__all__ = ["IngestionWorkflow"]
+
+def __getattr__(name: str):
+    if name == "IngestionWorkflow":
+        from .ingestion import IngestionWorkflow
+        return IngestionWorkflow
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# from .analysis import AnalysisWorkflow
+# from .retrieval import RetrievalWorkflow
+# from .comparison import ComparisonWorkflow
+
+# 可以根据需要导出工作流类
@@ -9,11 +9,11 @@ from typing import Union, IO, Optional, List, Dict, Any
 import time
 import traceback
 
-from scrsit.core.document.models import Document, DocumentType
-from scrsit.core.plugin_manager import PluginManager
-from scrsit.core.exceptions import WorkflowError, ParsingError, EmbeddingError, AnalysisError, StorageError
-from scrsit.core.interfaces import (
-    BaseParser, BaseChunker, BaseEmbedder, BaseAnalyzer,
+from src.scrsit.core.document.models import Document, DocumentType
+from src.scrsit.core.plugin_manager import PluginManager
+from src.scrsit.core.exceptions import WorkflowError, ParsingError, EmbeddingError, AnalysisError, StorageError
+from src.scrsit.core.interfaces import (
+    BaseParser, BaseChunker, BaseEmbedder, BaseAnalyzer, AnalysisType,
     BaseDocumentStore, BaseVectorStore, BaseStructuredStore
 )
 
@@ -150,10 +150,10 @@ class IngestionWorkflow:
 
                         # 根据分析结果类型更新 Document 对象 (需要约定好数据结构)
                         # 例如，如果是实体提取器返回 Entity 列表
-                        if analyzer.analysis_type == "entity_extraction" and isinstance(analysis_result, list):
+                        if analyzer.analysis_type == AnalysisType.ENTITY_EXTRACTION and isinstance(analysis_result, list):
                              document.entities.extend(analysis_result)
                              logger.info(f"实体提取器找到 {len(analysis_result)} 个实体。")
-                        # elif analyzer.analysis_type == "relationship_extraction" ...
+                        # elif analyzer.analysis_type == AnalysisType.RELATIONSHIP_EXTRACTION ...
                         # ... 处理其他类型的分析结果 ...
                         else:
                              logger.warning(f"分析器 '{analyzer.__class__.__name__}' 返回了未知的或未处理的结果类型: {type(analysis_result)}")
@@ -335,12 +335,18 @@ class PdfParser(BaseParser):
                  logger.warning(f"无法检查文件大小: {file_path}, Error: {e}")
 
     def _calculate_checksum(self, file_path: Path) -> str:
-        """计算文件的 SHA1 校验和。"""
-        hasher = hashlib.sha1()
+        """
+        计算文件的 SHA1 校验和。
+        校验和仅用于内容去重而非安全用途，声明 usedforsecurity=False 后
+        hashlib 可直接走 OpenSSL 的硬件加速实现 (SHA-NI / ARMv8 SHA1 扩展)。
+        """
+        hasher = hashlib.sha1(usedforsecurity=False)
+        buffer = bytearray(1024 * 1024) # 复用 1MB 读缓冲，减少系统调用与内存分配
+        view = memoryview(buffer)
         try:
-            with open(file_path, 'rb') as f:
-                while chunk := f.read(8192): # Read in chunks
-                    hasher.update(chunk)
+            with open(file_path, 'rb', buffering=0) as f:
+                while n := f.readinto(buffer): # Read in chunks
+                    hasher.update(view[:n])
             return hasher.hexdigest()
         except Exception as e:
             logger.warning(f"无法计算文件校验和: {file_path}, Error: {e}")
@@ -371,7 +377,9 @@ class PdfParser(BaseParser):
         )
 
         full_content_parts = []
-        page_infos = {page['page_info']['page_no']: page['page_info'] for page in model_data}
+        # 按页码索引 model.json 页面，后续按页查找元素为 O(1)
+        model_pages = {page['page_info']['page_no']: page for page in model_data}
+        page_infos = {page_no: page['page_info'] for page_no, page in model_pages.items()}
 
         # 遍历 middle_data 中的页面信息
         for page_index, page_data in enumerate(middle_data.get("pdf_info", [])):
@@ -440,7 +448,7 @@ class PdfParser(BaseParser):
                            # 暂不直接读取图片内容放入 Table.content
 
                     # 尝试从 model.json 获取更精确的表格 bbox (如果需要)
-                    # model_table = self._find_model_element(model_data, page_no, block.get("bbox"), 5) # Category 5 = table
+                    # model_table = self._find_model_element(model_pages, page_no, block.get("bbox"), 5) # Category 5 = table
 
                     tab = Table(
                         id=f"{doc.id}_tbl_{len(doc.tables)}",
@@ -458,7 +466,7 @@ class PdfParser(BaseParser):
                  eq_span = self._find_span_by_type(eq_block, "interline_equation")
                  if eq_span and eq_span.get("content"): # middle.json 的 content 可能是公式文本
                      # 尝试在 model.json 中找到对应的公式并获取 LaTeX
-                     model_formula = self._find_model_element(model_data, page_no, eq_block.get("bbox"), 8) # Category 8 = isolate_formula
+                     model_formula = self._find_model_element(model_pages, page_no, eq_block.get("bbox"), 8) # Category 8 = isolate_formula
                      latex_content = model_formula.get("latex") if model_formula else None
 
                      formula = Formula(
@@ -485,34 +493,39 @@ class PdfParser(BaseParser):
         return doc
 
     def _extract_text_from_block(self, block: Dict[str, Any]) -> str:
-        """递归地从 block 及其子 block 中提取所有文本 span 的内容。"""
+        """从 block 及其子 block 中提取所有文本 span 的内容 (深度优先，使用显式栈代替递归)。"""
         block_text_parts = []
-        # 处理当前层级的 lines 和 spans
-        for line in block.get("lines", []):
-            for span in line.get("spans", []):
-                # 只提取 'text' 类型的 span 内容，忽略图片、表格等的文本表示
-                # 行内公式也暂时忽略，避免混淆
-                if span.get("type") == "text" and span.get("content"):
-                    block_text_parts.append(span["content"])
-        # 递归处理子 blocks (如果存在) - 注意 block 结构定义可能嵌套
-        if "blocks" in block: # 检查是否是一级块
-            for sub_block in block.get("blocks", []):
-                 block_text_parts.append(self._extract_text_from_block(sub_block))
+        append = block_text_parts.append # 热循环中预先绑定方法
+        stack = [block]
+        while stack:
+            current = stack.pop()
+            # 处理当前层级的 lines 和 spans
+            for line in current.get("lines", []):
+                for span in line.get("spans", []):
+                    # 只提取 'text' 类型的 span 内容，忽略图片、表格等的文本表示
+                    # 行内公式也暂时忽略，避免混淆
+                    if span.get("type") == "text":
+                        content = span.get("content")
+                        if content:
+                            append(content)
+            # 子 blocks 逆序入栈以保持原有顺序 - 注意 block 结构定义可能嵌套
+            if "blocks" in current: # 检查是否是一级块
+                stack.extend(reversed(current.get("blocks", [])))
 
         return "".join(block_text_parts) # 直接拼接，更复杂可以加换行
 
     def _find_span_by_type(self, block: Dict[str, Any], span_type: str) -> Optional[Dict[str, Any]]:
-        """在 block 的 lines 中查找指定类型的第一个 span。"""
-        for line in block.get("lines", []):
-            for span in line.get("spans", []):
-                if span.get("type") == span_type:
-                    return span
-        # 递归查找子 block (如果是一级块)
-        if "blocks" in block:
-            for sub_block in block.get("blocks", []):
-                found_span = self._find_span_by_type(sub_block, span_type)
-                if found_span:
-                    return found_span
+        """在 block 的 lines 中查找指定类型的第一个 span (深度优先，使用显式栈代替递归)。"""
+        stack = [block]
+        while stack:
+            current = stack.pop()
+            for line in current.get("lines", []):
+                for span in line.get("spans", []):
+                    if span.get("type") == span_type:
+                        return span
+            # 子 block 逆序入栈，保证按原顺序查找 (如果是一级块)
+            if "blocks" in current:
+                stack.extend(reversed(current.get("blocks", [])))
         return None
 
     def _extract_caption_footnote(self, page_data: Dict[str, Any], element_bbox: List[float], element_type: str) -> Optional[str]:
@@ -544,12 +557,12 @@ class PdfParser(BaseParser):
 
         return desc if desc else None
 
-    def _find_model_element(self, model_data: List[Dict[str, Any]], page_no: int, bbox: List[float], category_id: int) -> Optional[Dict[str, Any]]:
+    def _find_model_element(self, model_pages: Dict[int, Dict[str, Any]], page_no: int, bbox: List[float], category_id: int) -> Optional[Dict[str, Any]]:
         """
-        在 model.json 数据中查找指定页面、类别且与给定 bbox 大致匹配的元素。
+        在 model.json 数据 (按页码索引) 中查找指定页面、类别且与给定 bbox 大致匹配的元素。
         使用 Bbox 中心点距离或 IoU 进行匹配（简化实现：中心点距离）。
         """
-        target_page = next((page for page in model_data if page.get("page_info", {}).get("page_no") == page_no), None)
+        target_page = model_pages.get(page_no)
         if not target_page or not bbox:
             return None
 
@@ -0,0 +1,209 @@
+import threading
+import time
+
+import pytest
+from PIL import Image
+
+from src.scrsit.core.document.models import Document
+from src.scrsit.core.exceptions import EmbeddingError
+from src.scrsit.core.interfaces import (
+    BaseDocumentStore, BaseEmbedder, BasePluginInterface, BaseOCRProvider, BaseStructuredStore
+)
+from src.scrsit.core.interfaces import base_document_store, base_ocr_provider
+from src.scrsit.core.utils.helpers import map_concurrently
+
+
+class _MixinOCR(BasePluginInterface, BaseOCRProvider):
+    ocr_cache_size = 16
+
+    def extract_text(self, image, **kwargs):
+        self.calls += 1
+        return image.decode()
+
+
+class _SlottedOCR(BaseOCRProvider):
+    __slots__ = ("calls",)
+    ocr_cache_size = 16
+
+    def extract_text(self, image, **kwargs):
+        self.calls += 1
+        return image.decode()
+
+
+class _DefaultOCR(BaseOCRProvider):
+    def extract_text(self, image, **kwargs):
+        self.calls = getattr(self, "calls", 0) + 1
+        return image.decode()
+
+
+def test_plugin_interface_mixin_with_ocr_provider():
+    ocr = _MixinOCR(config={"lang": "en"})
+    ocr.calls = 0
+    assert ocr.config == {"lang": "en"}
+    assert ocr.extract_text_batch([b"a", b"b", b"a"]) == ["a", "b", "a"]
+    assert ocr.calls == 2
+    assert ocr.cache_stats() == {"hits": 1, "misses": 2, "size": 2}
+
+
+def test_ocr_cache_is_opt_in():
+    ocr = _DefaultOCR()
+    assert ocr.extract_text_batch([b"a", b"a"]) == ["a", "a"]
+    assert ocr.calls == 2
+    assert ocr.cache_stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_ocr_cache_disabled_for_slotted_provider_without_weakref():
+    ocr = _SlottedOCR()
+    ocr.calls = 0
+    assert ocr.extract_text_batch([b"a", b"a"]) == ["a", "a"]
+    assert ocr.calls == 2
+    assert ocr.cache_stats() == {"hits": 0, "misses": 0, "size": 0}
+
+
+def test_pil_image_digest_hashes_in_strips(monkeypatch):
+    monkeypatch.setattr(base_ocr_provider, "_PIL_HASH_STRIP_BYTES", 16)
+    image = Image.new("RGB", (4, 10), "white")
+    same = Image.new("RGB", (4, 10), "white")
+    other = image.copy()
+    other.putpixel((3, 9), (0, 0, 0))
+    digest = base_ocr_provider._image_digest(image)
+    assert digest == base_ocr_provider._image_digest(same)
+    assert digest != base_ocr_provider._image_digest(other)
+
+
+class _ShortEmbedder(BaseEmbedder):
+    dimension = 1
+
+    def embed(self, content, **kwargs):
+        return [[float(len(text))] for text in content][:-1] or [[0.0]]
+
+
+def test_embed_batched_rejects_missing_vectors():
+    with pytest.raises(EmbeddingError):
+        _ShortEmbedder().embed_batched(["a" * 40, "b" * 40], max_tokens=1000)
+
+
+def test_map_concurrently_preserves_order_and_runs_in_parallel():
+    barrier = threading.Barrier(2, timeout=5)
+
+    def work(i):
+        if i < 2:
+            barrier.wait() # 两个调用必须同时在运行，否则超时
+        time.sleep(0.01 * (5 - i))
+        return i * 10
+
+    assert map_concurrently(work, range(5), max_workers=2) == [0, 10, 20, 30, 40]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_map_concurrently_propagates_exceptions(max_workers):
+    def work(i):
+        if i == 2:
+            raise ValueError(i)
+        return i
+
+    with pytest.raises(ValueError):
+        map_concurrently(work, range(4), max_workers=max_workers)
+
+
+class _MemoryDocumentStore(BaseDocumentStore):
+    def __init__(self):
+        self.docs = {}
+
+    def save(self, document, **kwargs):
+        self.docs[document.id] = document
+
+    def get(self, doc_id, **kwargs):
+        if doc_id == "boom":
+            raise RuntimeError(doc_id)
+        return self.docs.get(doc_id)
+
+    def delete(self, doc_id, **kwargs):
+        return self.docs.pop(doc_id, None) is not None
+
+    def _all(self, **kwargs):
+        return self.docs.values()
+
+
+class _MemoryStructuredStore(BaseStructuredStore):
+    def __init__(self):
+        self.rows = {}
+
+    def save(self, collection, data, **kwargs):
+        self.rows[(collection, data["id"])] = data
+        return data["id"]
+
+    def get(self, collection, record_id, **kwargs):
+        return self.rows.get((collection, record_id))
+
+    def find(self, collection, query, **kwargs):
+        raise NotImplementedError
+
+    def update(self, collection, record_id, updates, **kwargs):
+        raise NotImplementedError
+
+    def delete(self, collection, record_id, **kwargs):
+        raise NotImplementedError
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_document_store_batch_defaults(max_workers):
+    store = _MemoryDocumentStore()
+    store.batch_max_workers = max_workers
+    docs = [Document(name=f"doc{i}") for i in range(6)]
+    store.save_batch(docs)
+    ids = [d.id for d in docs]
+
+    assert store.get_batch(ids[::-1] + ["missing"]) == docs[::-1] + [None]
+    assert store.delete_batch(ids[:3] + ["missing"]) == 3
+    assert sorted(store.docs) == sorted(ids[3:])
+    with pytest.raises(RuntimeError):
+        store.get_batch(ids[3:] + ["boom"])
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_structured_store_batch_defaults(max_workers):
+    store = _MemoryStructuredStore()
+    store.batch_max_workers = max_workers
+    rows = [{"id": f"r{i}"} for i in range(5)]
+
+    assert store.save_batch("entities", rows) == [r["id"] for r in rows]
+    assert store.get_batch("entities", ["r4", "x", "r0"]) == [rows[4], None, rows[0]]
+
+
+def test_find_matches_dotted_paths_and_attributes():
+    store = _MemoryDocumentStore()
+    a = Document(name="a", metadata={"author": "John", "meta": {"lang": "zh"}})
+    b = Document(name="b", metadata={"author": "Jane", "meta": {"lang": "zh"}})
+    store.save_batch([a, b])
+
+    assert store.find({"metadata.author": "John"}) == [a]
+    assert store.find({"metadata.meta.lang": "zh", "name": "b"}) == [b]
+    assert store.find({"metadata.missing": None}) == []
+    assert store.find({"metadata.author.deeper": "John"}) == []
+
+
+def test_compile_query_caches_hashable_queries():
+    compile_items = base_document_store._compile_items
+    compile_items.cache_clear()
+    first = base_document_store._compile_query({"name": "a", "metadata.author": "John"})
+    second = base_document_store._compile_query({"metadata.author": "John", "name": "a"})
+    assert first is second
+    assert compile_items.cache_info().hits == 1
+
+
+def test_compile_query_falls_back_for_unhashable_values():
+    compile_items = base_document_store._compile_items
+    compile_items.cache_clear()
+    predicate = base_document_store._compile_query({"metadata.tags": ["x", "y"]})
+    assert predicate(Document(name="a", metadata={"tags": ["x", "y"]}))
+    assert not predicate(Document(name="b", metadata={"tags": ["x"]}))
+    assert compile_items.cache_info().currsize == 0
+
+
+def test_find_without_all_hook_is_not_implemented():
+    class _NoScanStore(BaseDocumentStore):
+        save = get = delete = lambda self, *args, **kwargs: None
+
+    with pytest.raises(NotImplementedError):
+        _NoScanStore().find({"name": "a"})
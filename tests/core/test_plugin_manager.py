@@ -0,0 +1,108 @@
+import importlib.metadata
+
+import pytest
+
+from src.scrsit.core.config.settings import AppSettings
+from src.scrsit.core.exceptions import ConfigurationError, PluginLoadError
+from src.scrsit.core.interfaces import (
+    AnalysisType, BaseAnalyzer, BaseParser, BasePluginInterface
+)
+from src.scrsit.core.plugin_manager import PluginManager
+
+
+class GoodAnalyzer(BasePluginInterface, BaseAnalyzer):
+    def analyze(self, content, **kwargs):
+        return []
+
+    @property
+    def analysis_type(self):
+        return AnalysisType.ENTITY_EXTRACTION
+
+
+class NotAnAnalyzer:
+    def __init__(self, config=None):
+        self.config = config
+
+
+class GoodParser(BasePluginInterface, BaseParser):
+    def parse(self, file_source, **kwargs):
+        raise NotImplementedError
+
+    def supported_types(self):
+        return ["txt"]
+
+
+def _ep(name, attr, group):
+    return importlib.metadata.EntryPoint(name=name, value=f"{__name__}:{attr}", group=group)
+
+
+ENTRY_POINTS = importlib.metadata.EntryPoints([
+    _ep("good", "GoodAnalyzer", "scrsit.analyzers"),
+    _ep("wrong_type", "NotAnAnalyzer", "scrsit.analyzers"),
+    importlib.metadata.EntryPoint(name="missing", value="scrsit_no_such_module:Analyzer", group="scrsit.analyzers"),
+    _ep("good_parser", "GoodParser", "scrsit.parsers"),
+    importlib.metadata.EntryPoint(name="broken_parser", value="scrsit_no_such_module:Parser", group="scrsit.parsers"),
+])
+
+
+@pytest.fixture(autouse=True)
+def stub_entry_points(monkeypatch):
+    monkeypatch.setattr(PluginManager, "_entry_points_cache", ENTRY_POINTS)
+
+
+def _manager(**overrides):
+    overrides.setdefault("enabled_analyzers", ["good", "wrong_type", "missing", "unknown"])
+    settings = AppSettings(**overrides)
+    return PluginManager(settings)
+
+
+def test_lazy_discovery_does_not_import_plugin_classes():
+    manager = _manager()
+    assert manager._plugins[BaseAnalyzer] == {}
+    assert manager.list_available_plugins() == {
+        "parsers": ["broken_parser", "good_parser"],
+        "analyzers": ["good", "missing", "wrong_type"],
+    }
+
+    analyzer = manager.get_analyzer("good")
+    assert isinstance(analyzer, GoodAnalyzer)
+    assert manager.get_analyzer("good") is analyzer
+    assert manager._plugins[BaseAnalyzer] == {"good": GoodAnalyzer}
+
+
+@pytest.mark.parametrize("name", ["wrong_type", "missing"])
+def test_lazy_load_failure_raises_and_drops_plugin(name):
+    manager = _manager()
+    with pytest.raises(PluginLoadError):
+        manager.get_analyzer(name)
+    assert name not in manager.list_available_plugins()["analyzers"]
+
+
+def test_enabled_analyzers_skip_broken_plugins():
+    manager = _manager()
+    assert [type(a) for a in manager.get_enabled_analyzers()] == [GoodAnalyzer]
+
+
+def test_single_loadable_plugin_used_as_default():
+    manager = _manager()
+    assert isinstance(manager.get_parser(), GoodParser)
+
+
+def test_no_default_with_several_loadable_plugins():
+    manager = _manager(enabled_analyzers=[])
+    manager._entry_points[BaseParser]["other_parser"] = _ep("other_parser", "GoodParser", "scrsit.parsers")
+    with pytest.raises(ConfigurationError):
+        manager.get_parser()
+
+
+@pytest.mark.parametrize("parallel", [False, True])
+def test_eager_load_skips_broken_plugins(parallel):
+    manager = _manager(eager_plugin_load=True, parallel_plugin_load=parallel)
+    assert manager._plugins[BaseAnalyzer] == {"good": GoodAnalyzer}
+    assert manager._plugins[BaseParser] == {"good_parser": GoodParser}
+    assert manager.list_available_plugins() == {
+        "parsers": ["good_parser"],
+        "analyzers": ["good"],
+    }
+    assert [type(a) for a in manager.get_enabled_analyzers()] == [GoodAnalyzer]
+    assert isinstance(manager.get_parser(), GoodParser)